@@ -1,25 +1,162 @@
+import functools
 import hashlib
-import io
 import json
 import logging
 import os
 import re
+import shutil
+import tempfile
+import threading
 import time
 import zipfile
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures import wait
 from pathlib import Path
 from typing import Union
 from urllib.parse import urlparse
 
-import pandas as pd
 import requests
+import requests_cache
 from jsonpath_ng import parse
+from requests.adapters import HTTPAdapter
 from scitree import scitree
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from datahugger.utils import _format_filename
 from datahugger.utils import _get_url
 from datahugger.utils import _is_url
 
+# number of bytes read from the response per iteration while downloading
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# maximum number of files downloaded concurrently (and pooled connections)
+MAX_DOWNLOAD_WORKERS = 16
+
+# maximum number of folder listings and pages requested concurrently
+MAX_LISTING_WORKERS = 8
+
+# number of seconds metadata responses are cached
+METADATA_CACHE_EXPIRE_AFTER = 3600
+
+# number of bytes read from disk per iteration while computing checksums
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+CHECKSUM_HASH_TYPES = ("md5", "sha1", "sha224", "sha256", "sha384", "sha512")
+
+# jsonpaths consisting of field names only, e.g. 'content_details.size'
+SIMPLE_JSONPATH_REGEXP = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*)*$")
+
+# class attributes holding the jsonpath of a file attribute
+ATTR_JSONPATH_NAME_REGEXP = re.compile(r"^ATTR_\w+_JSONPATH$")
+ATTR_JSONPATH_NAMES = (
+    "ATTR_NAME_JSONPATH",
+    "ATTR_FILE_LINK_JSONPATH",
+    "ATTR_FOLDER_LINK_JSONPATH",
+    "ATTR_SIZE_JSONPATH",
+    "ATTR_HASH_JSONPATH",
+    "ATTR_HASH_TYPE_JSONPATH",
+    "ATTR_KIND_JSONPATH",
+)
+
+
+def _parse_json_response(res):
+    """Parse the JSON body of a response, with orjson if installed."""
+    if orjson is not None:
+        return orjson.loads(res.content)
+    return res.json()
+
+
+def _content_range_start(res):
+    """First byte position of the Content-Range of a response, or None."""
+    match = re.match(r"bytes (\d+)-", res.headers.get("Content-Range", ""))
+    return int(match.group(1)) if match else None
+
+
+def _create_session(session=None):
+    """Mount a connection pool sized for concurrent downloads on a session."""
+    if session is None:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=MAX_DOWNLOAD_WORKERS, pool_maxsize=MAX_DOWNLOAD_WORKERS
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_jsonpath(jsonp):
+    """Parse and cache a jsonpath expression."""
+    return parse(jsonp)
+
+
+def _compile_jsonpath(jsonp):
+    if isinstance(jsonp, str):
+        return _parse_jsonpath(jsonp)
+    return jsonp
+
+
+@functools.lru_cache(maxsize=512)
+def _jsonpath_getter(jsonp):
+    """Return a function that extracts the first match of jsonp from a record.
+
+    Plain dotted paths like 'links.self' are resolved with dict lookups,
+    bypassing jsonpath. Raises an exception if there is no match.
+    """
+    if SIMPLE_JSONPATH_REGEXP.match(jsonp):
+        keys = jsonp.split(".")
+
+        def getter(record):
+            for key in keys:
+                if not isinstance(record, dict):
+                    raise KeyError(key)
+                record = record[key]
+            return record
+
+        return getter
+
+    return _first_match_getter(_parse_jsonpath(jsonp))
+
+
+def _first_match_getter(jsonpath_expression):
+    return lambda record: jsonpath_expression.find(record)[0].value
+
+
+def _compile_jsonpath_getter(jsonp):
+    if isinstance(jsonp, str):
+        return _jsonpath_getter(jsonp)
+    return _first_match_getter(jsonp)
+
+
+def _hash_file(path, hash_type, bufsize=CHECKSUM_CHUNK_SIZE):
+    """Compute the hex digest of a file.
+
+    Returns a tuple with the path and the digest. The digest is None
+    for unsupported hash types.
+    """
+    if hash_type not in CHECKSUM_HASH_TYPES:
+        return path, None
+
+    with open(path, "rb", buffering=0) as f:
+        # Python 3.11+ runs the read loop in C
+        if hasattr(hashlib, "file_digest"):
+            return path, hashlib.file_digest(f, hash_type).hexdigest()
+
+        h = hashlib.new(hash_type)
+        while chunk := f.read(bufsize):
+            h.update(chunk)
+
+    return path, h.hexdigest()
+
 
 class DownloadResult:
     """Result class after downloading the dataset."""
@@ -48,6 +185,31 @@ class DatasetDownloader:
 
     API_URL = None
 
+    # fixed hash type of all files, used instead of ATTR_HASH_TYPE_JSONPATH
+    ATTR_HASH_TYPE_VALUE = None
+
+    # getters compiled from the ATTR_*_JSONPATH class attributes, None if
+    # the attribute is not available
+    _JSONPATH_GETTERS = dict.fromkeys(ATTR_JSONPATH_NAMES)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # compile the jsonpaths once at class definition, jsonpaths defined
+        # as properties are resolved on access
+        getters = dict.fromkeys(ATTR_JSONPATH_NAMES)
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if not ATTR_JSONPATH_NAME_REGEXP.match(name):
+                    continue
+
+                if isinstance(value, property):
+                    getters.pop(name, None)
+                else:
+                    getters[name] = _compile_jsonpath_getter(value)
+
+        cls._JSONPATH_GETTERS = getters
+
     def __init__(
         self,
         resource,
@@ -64,6 +226,7 @@ class DatasetDownloader:
         self.resource = resource
         self.max_file_size = max_file_size
         self.filter_files = filter_files
+        self._filter_files_regexp = re.compile(filter_files) if filter_files else None
         self.force_download = force_download
         self.progress = progress
         self.unzip = unzip
@@ -71,60 +234,103 @@ class DatasetDownloader:
         self.print_only = print_only
         self.params = params
 
+        # folders created during a download, shared between download threads
+        self._created_dirs = set()
+        self._created_dirs_lock = threading.Lock()
+
+        # share connections between requests to the same host
+        self._session = _create_session()
+
+        # created on first use, see _metadata_session
+        self._metadata_session_lock = threading.Lock()
+
+    @property
+    def _metadata_session(self):
+        """Session for metadata requests.
+
+        Responses are cached and revalidated with ETags, unless the download
+        is forced. The cache is created on first use, so downloaders that
+        don't list metadata don't touch the cache folder.
+        """
+        with self._metadata_session_lock:
+            if hasattr(self, "_metadata_session_cache"):
+                return self._metadata_session_cache
+
+            if self.force_download:
+                self._metadata_session_cache = self._session
+            else:
+                self._metadata_session_cache = _create_session(
+                    requests_cache.CachedSession(
+                        "datahugger_metadata_cache",
+                        expire_after=METADATA_CACHE_EXPIRE_AFTER,
+                        backend="filesystem",
+                        use_cache_dir=True,
+                    )
+                )
+
+            return self._metadata_session_cache
+
     def _get_attr_attr(self, record, jsonp):
         try:
-            jsonpath_expression = parse(jsonp)
-            return jsonpath_expression.find(record)[0].value
+            return _compile_jsonpath_getter(jsonp)(record)
+        except Exception:
+            return None
+
+    def _get_attr_jsonpath(self, record, name, default=None):
+        """Get an attribute with the getter compiled for the class attribute.
+
+        Returns default if the class has no jsonpath for the attribute.
+        """
+        try:
+            getter = self._JSONPATH_GETTERS[name]
+        except KeyError:
+            if not hasattr(self, name):
+                return default
+            return self._get_attr_attr(record, getattr(self, name))
+
+        if getter is None:
+            return default
+
+        try:
+            return getter(record)
         except Exception:
             return None
 
     def _get_attr_link(self, record, **kwargs):
         # get the link to the folder
         if self._get_attr_kind(record) == "folder":
-            if not hasattr(self, "ATTR_FOLDER_LINK_JSONPATH"):
-                return None
-
-            return self._get_attr_attr(record, self.ATTR_FOLDER_LINK_JSONPATH)
+            return self._get_attr_jsonpath(record, "ATTR_FOLDER_LINK_JSONPATH")
 
         # get the link to the file
         else:
-            if not hasattr(self, "ATTR_FILE_LINK_JSONPATH"):
-                return None
-
-            return self._get_attr_attr(record, self.ATTR_FILE_LINK_JSONPATH)
+            return self._get_attr_jsonpath(record, "ATTR_FILE_LINK_JSONPATH")
 
     def _get_attr_name(self, record):
-        if not hasattr(self, "ATTR_NAME_JSONPATH"):
-            return None
-
-        return self._get_attr_attr(record, self.ATTR_NAME_JSONPATH)
+        return self._get_attr_jsonpath(record, "ATTR_NAME_JSONPATH")
 
     def _get_attr_size(self, record):
-        if not hasattr(self, "ATTR_SIZE_JSONPATH"):
-            return None
-
-        return self._get_attr_attr(record, self.ATTR_SIZE_JSONPATH)
+        return self._get_attr_jsonpath(record, "ATTR_SIZE_JSONPATH")
 
     def _get_attr_hash(self, record):
-        if not hasattr(self, "ATTR_HASH_JSONPATH"):
-            return None
-
-        return self._get_attr_attr(record, self.ATTR_HASH_JSONPATH)
+        return self._get_attr_jsonpath(record, "ATTR_HASH_JSONPATH")
 
     def _get_attr_hash_type(self, record):
-        if hasattr(self, "ATTR_HASH_TYPE_VALUE"):
+        if self.ATTR_HASH_TYPE_VALUE is not None:
             return self.ATTR_HASH_TYPE_VALUE
 
-        if not hasattr(self, "ATTR_HASH_TYPE_JSONPATH"):
-            return None
-
-        return self._get_attr_attr(record, self.ATTR_HASH_TYPE_JSONPATH)
+        return self._get_attr_jsonpath(record, "ATTR_HASH_TYPE_JSONPATH")
 
     def _get_attr_kind(self, record):
-        if not hasattr(self, "ATTR_KIND_JSONPATH"):
-            return "file"
+        return self._get_attr_jsonpath(record, "ATTR_KIND_JSONPATH", default="file")
+
+    def _makedirs(self, folder):
+        """Create a folder, only touching the file system once per folder."""
+        with self._created_dirs_lock:
+            if folder in self._created_dirs:
+                return
 
-        return self._get_attr_attr(record, self.ATTR_KIND_JSONPATH)
+            folder.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(folder)
 
     def download_file(
         self,
@@ -151,6 +357,8 @@ class DatasetDownloader:
             The MD5 hash of the file.
 
         """
+        display_name = _format_filename(file_name)
+
         if (
             file_size is not None
             and self.max_file_size is not None
@@ -158,46 +366,94 @@ class DatasetDownloader:
         ):
             logging.info(f"Skipping large file {file_link}")
             if self.progress:
-                print(f"{_format_filename(file_name)}: SKIPPED")
+                print(f"{display_name}: SKIPPED")
             return
-        
-        if (
-            self.filter_files and
-            not re.match(self.filter_files, file_name)
-            ):
-            
+
+        if self._filter_files_regexp and not self._filter_files_regexp.match(file_name):
             logging.info(f"Skipping file by filter {file_link}")
             if self.progress:
-                print(f"{_format_filename(file_name)}: SKIPPED")
+                print(f"{display_name}: SKIPPED")
             return
 
         if not self.print_only:
-            logging.info(f"Downloading file {file_link}")
-            res = requests.get(file_link, stream=True)
-
             output_fp = Path(output_folder, file_name)
-            Path(output_fp).parent.mkdir(parents=True, exist_ok=True)
+            self._makedirs(output_fp.parent)
 
+            # skip complete files before issuing the request and resume
+            # incomplete files from where the previous download stopped
+            existing_size = 0
+            headers = {}
             if not self.force_download and output_fp.exists():
+                existing_size = output_fp.stat().st_size
+
+                try:
+                    expected_size = int(file_size)
+                except (TypeError, ValueError):
+                    expected_size = None
+
+                if expected_size is None or existing_size >= expected_size:
+                    print("File already exists:", file_name)
+                    return
+
+                # resume the raw bytes, a range of an encoded representation
+                # can't be decoded on its own
+                headers["Range"] = f"bytes={existing_size}-"
+                headers["Accept-Encoding"] = "identity"
+
+            logging.info(f"Downloading file {file_link}")
+            res = self._session.get(file_link, stream=True, headers=headers)
+
+            # the range starts at or beyond the end of the file on the server
+            if headers and res.status_code == 416:
+                res.close()
                 print("File already exists:", file_name)
                 return
 
+            # download the full file if the server sends a different range
+            if res.status_code == 206 and _content_range_start(res) != existing_size:
+                logging.info(f"Unexpected range for {file_link}, downloading again")
+                res.close()
+                res = self._session.get(file_link, stream=True)
+
+            # skip the file instead of overwriting (partial) files with an
+            # error response, e.g. for restricted files
+            if not res.ok:
+                res.close()
+                logging.error(
+                    f"Failed to download file {file_link}: HTTP {res.status_code}"
+                )
+                print(f"{display_name}: FAILED")
+                return
+
+            # the server can ignore the range and send the full file
+            if res.status_code == 206:
+                logging.info(f"Resuming file {file_link} at byte {existing_size}")
+                mode = "ab"
+            else:
+                existing_size = 0
+                mode = "wb"
+
             if self.progress:
-                with tqdm.wrapattr(
-                    open(output_fp, "wb"),
-                    "write",
+                with tqdm(
                     miniters=1,
-                    desc=_format_filename(file_name),
-                    total=int(res.headers.get("content-length", 0)),
+                    desc=display_name,
+                    initial=existing_size,
+                    total=existing_size + int(res.headers.get("content-length", 0)),
+                    unit="B",
+                    unit_scale=True,
+                    unit_divisor=1024,
                     bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
-                ) as fout:
-                    for chunk in res.iter_content(chunk_size=4096):
-                        fout.write(chunk)
+                ) as pbar, open(output_fp, mode) as f:
+                    for chunk in res.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        pbar.update(len(chunk))
             else:
-                with open(output_fp, "wb") as f:
-                    f.write(res.content)
+                # stream the body to disk instead of buffering it in memory
+                res.raw.decode_content = True
+                with open(output_fp, mode) as f:
+                    shutil.copyfileobj(res.raw, f, length=DOWNLOAD_CHUNK_SIZE)
         else:
-            print(f"{_format_filename(file_name)}: COMPLETE")
+            print(f"{display_name}: COMPLETE")
 
     def _parse_url(self, url):
         if not isinstance(url, str) or not _is_url(url):
@@ -210,14 +466,21 @@ class DatasetDownloader:
             raise ValueError(f"Failed to parse URL '{url}'") from err
 
     def _unpack_single_folder(self, zip_url, output_folder):
-        r = requests.get(zip_url)
-        z = zipfile.ZipFile(io.BytesIO(r.content))
-
-        for zip_info in z.infolist():
-            if zip_info.filename[-1] == "/":
-                continue
-            zip_info.filename = os.path.basename(zip_info.filename)
-            z.extract(zip_info, output_folder)
+        r = self._session.get(zip_url, stream=True)
+        r.raise_for_status()
+        r.raw.decode_content = True
+
+        # spool to disk, SpooledTemporaryFile is not seekable for zipfile < 3.11
+        with tempfile.TemporaryFile() as tmp:
+            shutil.copyfileobj(r.raw, tmp, length=DOWNLOAD_CHUNK_SIZE)
+            tmp.seek(0)
+
+            with zipfile.ZipFile(tmp) as z:
+                for zip_info in z.infolist():
+                    if zip_info.filename[-1] == "/":
+                        continue
+                    zip_info.filename = os.path.basename(zip_info.filename)
+                    z.extract(zip_info, output_folder)
 
     def _check_checksums(self, output_folder, files_info):
         """Will compare the checksum values in the files_info with the checksums
@@ -236,44 +499,34 @@ class DatasetDownloader:
         try:
             checksums = {}
 
-            df = pd.DataFrame(files_info)
-
-            # loop through the downloaded files in the output_folder
-            for subdir, dirs, files in os.walk(output_folder):
-                logging.info(f"Not using the dirs: {dirs}")
-                for file in files:
-                    filepath = os.path.join(subdir, file)
-                    df2 = df[df["name"] == file].reset_index()
-                    try:
-                        hash = df2["hash"][0]
-                    except Exception as e:
-                        logging.info(f"Setting hash to None: {e}")
-                        hash = None
-                    try:
-                        hash_type = df2["hash_type"][0]
-                    except Exception as e:
-                        logging.info(f"Setting hash_type to None: {e}")
-                        hash_type = None
-                    newhash = None
-                    with open(filepath, "rb") as f:
-                        if hash_type == "md5":
-                            newhash = hashlib.md5(f.read()).hexdigest()
-                        if hash_type == "sha1":
-                            newhash = hashlib.sha1(f.read()).hexdigest()
-                        if hash_type == "sha224":
-                            newhash = hashlib.sha224(f.read()).hexdigest()
-                        if hash_type == "sha256":
-                            newhash = hashlib.sha256(f.read()).hexdigest()
-                        if hash_type == "sha384":
-                            newhash = hashlib.sha384(f.read()).hexdigest()
-                        if hash_type == "sha512":
-                            newhash = hashlib.sha512(f.read()).hexdigest()
-                    hash_match = hash == newhash
-                    if hash is not None and hash_type is not None:
-                        status = f"---> Checksum match: {hash_match} - {file}"
-                        print(status)
-                        logging.info(status)
-                        checksums[file] = hash_match
+            # index the file information by the relative path of the file
+            files_by_name = {f["name"]: f for f in files_info}
+
+            # collect the files that are downloaded and have a known hash
+            to_check = []
+            for file, file_info in files_by_name.items():
+                filepath = os.path.join(output_folder, file)
+                if not os.path.isfile(filepath):
+                    logging.info(f"Skipping checksum of missing file: {file}")
+                    continue
+
+                if file_info.get("hash") is None or file_info.get("hash_type") is None:
+                    continue
+
+                to_check.append((file, filepath, file_info))
+
+            # hashlib releases the GIL, so threads hash files in parallel
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                digests = executor.map(
+                    lambda x: _hash_file(x[1], x[2]["hash_type"]), to_check
+                )
+
+                for (file, _, file_info), (_, newhash) in zip(to_check, digests):
+                    hash_match = file_info["hash"] == newhash
+                    status = f"---> Checksum match: {hash_match} - {file}"
+                    print(status)
+                    logging.info(status)
+                    checksums[file] = hash_match
 
             try:
                 timestamp = str(time.time()).split(".")[0]
@@ -291,28 +544,29 @@ class DatasetDownloader:
     def _pre_files(self):
         pass
 
-    def _get_files_recursive(self, url, folder_name=None, base_url=None):
-        if not isinstance(url, str):
-            ValueError(f"Expected url to be string type, got {type(url)}")
+    def _get_files_page(self, url, folder_name=None, base_url=None):
+        """Get the files of a single folder listing or page.
 
-        result = []
+        Returns a tuple with a list of (index, file) tuples of the files
+        found and a list of (index, url, folder_name) tuples of subfolders
+        and next pages that still need to be listed. The index is the
+        position of the entry on the page, the next page comes last.
+        """
+        files = []
+        pending = []
 
         # get the data from URL
-        res = requests.get(url)
-        response = res.json()
+        res = self._metadata_session.get(url)
+        response = _parse_json_response(res)
 
         # find path to raw files
         if hasattr(self, "META_FILES_JSONPATH"):
-            if isinstance(self.META_FILES_JSONPATH, str):
-                jsonpath_expression = parse(self.META_FILES_JSONPATH)
-            else:
-                jsonpath_expression = self.META_FILES_JSONPATH
-
+            jsonpath_expression = _compile_jsonpath(self.META_FILES_JSONPATH)
             files_raw = [x.value for x in jsonpath_expression.find(response)]
         else:
             files_raw = response
 
-        for f in files_raw:
+        for i, f in enumerate(files_raw):
             # create the file or folder path
             if folder_name is None:
                 f_path = self._get_attr_name(f)
@@ -320,60 +574,105 @@ class DatasetDownloader:
                 f_path = str(Path(folder_name, self._get_attr_name(f)))
 
             if self._get_attr_kind(f) == "folder":
-                result.extend(
-                    self._get_files_recursive(
-                        self._get_attr_link(f, base_url=base_url), folder_name=f_path
-                    )
-                )
+                pending.append((i, self._get_attr_link(f, base_url=base_url), f_path))
             else:
-                result.append(
-                    {
-                        "link": self._get_attr_link(f, base_url=base_url),
-                        "name": f_path,
-                        "size": self._get_attr_size(f),
-                        "hash": self._get_attr_hash(f),
-                        "hash_type": self._get_attr_hash_type(f),
-                    }
+                files.append(
+                    (
+                        i,
+                        {
+                            "link": self._get_attr_link(f, base_url=base_url),
+                            "name": f_path,
+                            "size": self._get_attr_size(f),
+                            "hash": self._get_attr_hash(f),
+                            "hash_type": self._get_attr_hash_type(f),
+                        },
+                    )
                 )
 
         if hasattr(self, "PAGINATION_JSONPATH"):
-            jsonpath_expression = parse(self.PAGINATION_JSONPATH)
+            jsonpath_expression = _compile_jsonpath(self.PAGINATION_JSONPATH)
             next_url = jsonpath_expression.find(response)[0].value
 
             if next_url:
-                result.extend(
-                    self._get_files_recursive(next_url, folder_name=folder_name)
-                )
+                pending.append((len(files_raw), next_url, folder_name))
+
+        return files, pending
+
+    def _get_files_recursive(self, url, folder_name=None, base_url=None):
+        if not isinstance(url, str):
+            raise ValueError(f"Expected url to be string type, got {type(url)}")
+
+        # List independent folders and pages concurrently. Each file is keyed
+        # by the path of page and record indices leading to it, sorting the
+        # keys gives the depth-first order of a recursive listing.
+        results = {}
+        with ThreadPoolExecutor(max_workers=MAX_LISTING_WORKERS) as executor:
+            running = {}
+            pending = deque([((), url, folder_name)])
+
+            while pending or running:
+                while pending:
+                    key, page_url, page_folder = pending.popleft()
+                    future = executor.submit(
+                        self._get_files_page,
+                        page_url,
+                        folder_name=page_folder,
+                        base_url=base_url,
+                    )
+                    running[future] = key
 
-        return result
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    files, new_pending = future.result()
+                    for i, f in files:
+                        results[key + (i,)] = f
+                    for i, page_url, page_folder in new_pending:
+                        pending.append((key + (i,), page_url, page_folder))
+
+        return [results[key] for key in sorted(results)]
 
     @property
     def _params(self):
         """Params including url params."""
-        if hasattr(self, "__params"):
-            return self.__params
+        if hasattr(self, "_params_cache"):
+            return self._params_cache
 
         url = _get_url(self.resource)
         url_params = self._parse_url(url)
         if self.params:
             new_params = self.params.copy()
             new_params.update(url_params)
-            self.__params = new_params
+            self._params_cache = new_params
         else:
-            self.__params = url_params
+            self._params_cache = url_params
+
+        return self._params_cache
+
+    @property
+    def _base_url(self):
+        """Scheme and netloc of the resource url."""
+        if hasattr(self, "_base_url_cache"):
+            return self._base_url_cache
 
-        return self.__params
+        uri = urlparse(_get_url(self.resource))
+        self._base_url_cache = uri.scheme + "://" + uri.netloc
+
+        return self._base_url_cache
+
+    @property
+    def _files_cached(self):
+        """Whether the list of files is already retrieved."""
+        return hasattr(self, "_files")
 
     @property
     def files(self):
-        if hasattr(self, "_files"):
+        if self._files_cached:
             return self._files
 
         self._pre_files()
 
-        url = _get_url(self.resource)
-        uri = urlparse(url)
-        base_url = uri.scheme + "://" + uri.netloc
+        base_url = self._base_url
 
         self._files = self._get_files_recursive(
             self.API_URL_META.format(
@@ -399,9 +698,13 @@ class DatasetDownloader:
             self._unpack_single_folder(self.files[0]["link"], output_folder)
             return
 
-        files_info = []
-        for f in self.files:
-            files_info.append(f)
+        files_info = list(self.files)
+
+        # folders can be removed between downloads, check them again
+        with self._created_dirs_lock:
+            self._created_dirs.clear()
+
+        def download_file_info(f):
             self.download_file(
                 f["link"],
                 output_folder,
@@ -410,6 +713,27 @@ class DatasetDownloader:
                 file_hash=f["hash"],
                 file_hash_type=f["hash_type"],
             )
+
+        # nothing is downloaded, print the files in order
+        if self.print_only:
+            for f in files_info:
+                download_file_info(f)
+        else:
+            max_workers = max(1, min(MAX_DOWNLOAD_WORKERS, len(files_info)))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(download_file_info, f) for f in files_info]
+
+                # raise the first exception of a failed download (or an
+                # interrupt) without waiting for the downloads that didn't
+                # start yet
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                finally:
+                    for future in futures:
+                        future.cancel()
+
         # if checksum==True do checking of checksum
         if self.checksum:
             self._check_checksums(output_folder=output_folder, files_info=files_info)
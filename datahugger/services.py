@@ -5,14 +5,12 @@ import zipfile
 from pathlib import Path
 from typing import Union
 from urllib.parse import quote
-from urllib.parse import urlparse
 
 import requests
 from jsonpath_ng.jsonpath import Fields
 from jsonpath_ng.jsonpath import Slice
 
 from datahugger.base import DatasetDownloader
-from datahugger.utils import _get_url
 
 
 class ArXivDataset(DatasetDownloader):
@@ -115,7 +113,7 @@ class DataOneDataset(DatasetDownloader):
 
     @property
     def files(self):
-        if hasattr(self, "_files"):
+        if self._files_cached:
             return self._files
 
         doi_safe = quote(f"doi:{self._params['record_id']}", safe="")
@@ -153,6 +151,9 @@ class PangaeaDataset(DatasetDownloader):
 
     @property
     def files(self):
+        if self._files_cached:
+            return self._files
+
         # get the difference between collection and file
         r = requests.get(
             f"{self.API_URL}{self._params['record_id']}?format=metadata_jsonld"
@@ -179,7 +180,8 @@ class PangaeaDataset(DatasetDownloader):
                     }
                 )
 
-        return files
+        self._files = files
+        return self._files
 
 
 class DSpaceDataset(DatasetDownloader):
@@ -202,8 +204,7 @@ class DSpaceDataset(DatasetDownloader):
 
     @property
     def API_URL_META(self):
-        uri = urlparse(_get_url(self.resource))
-        base_url = uri.scheme + "://" + uri.netloc
+        base_url = self._base_url
 
         handle_id_url = f"{base_url}/rest/handle/{self._params['record_id']}"
         res = requests.get(handle_id_url)
@@ -346,7 +347,7 @@ class OSFDataset(DatasetDownloader):
     def _get_node_providers(self):
         """Get the providers of a node."""
         record_id = self._params["record_id"]
-        res = requests.get(f"{self.API_URL}/{record_id}/files/")
+        res = self._metadata_session.get(f"{self.API_URL}/{record_id}/files/")
         return set([prov["attributes"]["provider"] for prov in res.json()["data"]])
 
     def _get_files_recursive(self, url, folder_name=None, base_url=None):
@@ -385,7 +386,7 @@ class ZenodoDataset(DatasetDownloader):
     ATTR_HASH_JSONPATH = "checksum"
 
     def _get_attr_hash(self, record):
-        return self._get_attr_attr(record, self.ATTR_HASH_JSONPATH).split(":")[1]
+        return self._get_attr_jsonpath(record, "ATTR_HASH_JSONPATH").split(":")[1]
 
     def _get_attr_hash_type(self, record):
-        return self._get_attr_attr(record, self.ATTR_HASH_JSONPATH).split(":")[0]
+        return self._get_attr_jsonpath(record, "ATTR_HASH_JSONPATH").split(":")[0]
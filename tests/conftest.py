@@ -0,0 +1,60 @@
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+class _FileHandler(BaseHTTPRequestHandler):
+    """Serve the bytes in server.routes, honouring Range requests."""
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+
+        if self.path not in self.server.routes:
+            self._send(404, b"not found")
+            return
+
+        body = self.server.routes[self.path]
+        range_header = self.headers.get("Range")
+
+        if range_header is None or not self.server.accept_ranges:
+            self._send(200, body)
+            return
+
+        start = int(range_header.replace("bytes=", "").split("-")[0])
+        if start >= len(body):
+            self._send(416, b"error")
+            return
+
+        # misbehaving servers can send a different range than requested
+        start = max(0, start - self.server.range_shift)
+        content_range = f"bytes {start}-{len(body) - 1}/{len(body)}"
+        self._send(206, body[start:], {"Content-Range": content_range})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FileHandler)
+    server.routes = {}
+    server.accept_ranges = True
+    server.range_shift = 0
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,55 @@
+import hashlib
+import json
+
+import pytest
+
+from datahugger.base import CHECKSUM_HASH_TYPES
+from datahugger.base import DatasetDownloader
+from datahugger.base import _hash_file
+
+CONTENT = b"datahugger" * 100_000
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.mark.parametrize("hash_type", CHECKSUM_HASH_TYPES)
+def test_hash_file(data_file, hash_type):
+    expected = hashlib.new(hash_type, CONTENT).hexdigest()
+
+    assert _hash_file(data_file, hash_type) == (data_file, expected)
+
+
+@pytest.mark.parametrize("hash_type", CHECKSUM_HASH_TYPES)
+def test_hash_file_without_file_digest(data_file, hash_type, monkeypatch):
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    expected = hashlib.new(hash_type, CONTENT).hexdigest()
+
+    assert _hash_file(data_file, hash_type, bufsize=4096) == (data_file, expected)
+
+
+def test_hash_file_unsupported_type(data_file):
+    assert _hash_file(data_file, "crc32") == (data_file, None)
+
+
+def test_check_checksums(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "a.txt").write_bytes(b"abc")
+    (tmp_path / "b.txt").write_bytes(b"abc")
+
+    files_info = [
+        {"name": "sub/a.txt", "hash": hashlib.md5(b"abc").hexdigest()},
+        {"name": "b.txt", "hash": "wrong"},
+        {"name": "missing.txt", "hash": "wrong"},
+    ]
+    for f in files_info:
+        f["hash_type"] = "md5"
+
+    DatasetDownloader("http://localhost")._check_checksums(tmp_path, files_info)
+
+    (result_fp,) = (tmp_path / "generated").iterdir()
+    assert json.loads(result_fp.read_text()) == {"sub/a.txt": True, "b.txt": False}
@@ -0,0 +1,213 @@
+import io
+import shutil
+import threading
+import time
+import zipfile
+
+import pytest
+import requests_cache
+
+from datahugger.base import DatasetDownloader
+
+
+def test_unpack_single_folder(http_server, tmp_path):
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as z:
+        z.writestr("dataset/", "")
+        z.writestr("dataset/data.csv", "a,b\n1,2\n")
+        z.writestr("dataset/README.md", "readme")
+    http_server.routes["/dataset.zip"] = zip_buffer.getvalue()
+
+    DatasetDownloader(http_server.url)._unpack_single_folder(
+        f"{http_server.url}/dataset.zip", tmp_path
+    )
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["README.md", "data.csv"]
+    assert (tmp_path / "data.csv").read_text() == "a,b\n1,2\n"
+
+
+@pytest.mark.parametrize("progress", [True, False])
+def test_download_file_resume(http_server, tmp_path, progress):
+    http_server.routes["/data.bin"] = b"0123456789"
+    (tmp_path / "data.bin").write_bytes(b"0123")
+
+    DatasetDownloader(http_server.url, progress=progress).download_file(
+        f"{http_server.url}/data.bin", tmp_path, "data.bin", file_size=10
+    )
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+
+    # a range of the raw bytes, not of a compressed representation
+    assert http_server.requests[0]["Range"] == "bytes=4-"
+    assert http_server.requests[0]["Accept-Encoding"] == "identity"
+
+
+@pytest.mark.parametrize("progress", [True, False])
+def test_download_file_unexpected_range(http_server, tmp_path, progress):
+    http_server.routes["/data.bin"] = b"0123456789"
+    http_server.range_shift = 2
+    (tmp_path / "data.bin").write_bytes(b"0123")
+
+    DatasetDownloader(http_server.url, progress=progress).download_file(
+        f"{http_server.url}/data.bin", tmp_path, "data.bin", file_size=10
+    )
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+    assert "Range" not in http_server.requests[1]
+
+
+@pytest.mark.parametrize("progress", [True, False])
+def test_download_file_range_ignored(http_server, tmp_path, progress):
+    http_server.routes["/data.bin"] = b"0123456789"
+    http_server.accept_ranges = False
+    (tmp_path / "data.bin").write_bytes(b"01xx")
+
+    DatasetDownloader(http_server.url, progress=progress).download_file(
+        f"{http_server.url}/data.bin", tmp_path, "data.bin", file_size=10
+    )
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+
+
+def test_download_file_range_not_satisfiable(http_server, tmp_path):
+    http_server.routes["/data.bin"] = b"0123456789"
+    (tmp_path / "data.bin").write_bytes(b"0123456789")
+
+    # the repository reports a larger size than the file on the server
+    DatasetDownloader(http_server.url).download_file(
+        f"{http_server.url}/data.bin", tmp_path, "data.bin", file_size=20
+    )
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+
+
+def test_download_file_error_keeps_partial_file(http_server, tmp_path, capsys):
+    (tmp_path / "data.bin").write_bytes(b"0123")
+
+    DatasetDownloader(http_server.url).download_file(
+        f"{http_server.url}/missing.bin", tmp_path, "data.bin", file_size=10
+    )
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123"
+    assert "FAILED" in capsys.readouterr().out
+
+
+def test_download_file_skips_complete_file(http_server, tmp_path):
+    (tmp_path / "data.bin").write_bytes(b"0123456789")
+
+    # no route is registered, so a request would raise
+    DatasetDownloader(http_server.url).download_file(
+        f"{http_server.url}/missing.bin", tmp_path, "data.bin", file_size=10
+    )
+
+    assert (tmp_path / "data.bin").read_bytes() == b"0123456789"
+
+
+def test_metadata_cache_created_lazily(http_server, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    dataset = DatasetDownloader(http_server.url)
+    assert not hasattr(dataset, "_metadata_session_cache")
+
+    assert isinstance(dataset._metadata_session, requests_cache.CachedSession)
+    assert dataset._metadata_session is dataset._metadata_session
+
+
+def test_metadata_cache_bypassed_on_force_download(http_server):
+    dataset = DatasetDownloader(http_server.url, force_download=True)
+
+    assert dataset._metadata_session is dataset._session
+
+
+class _FilesDataset(DatasetDownloader):
+    REGEXP_ID = r"(?P<record_id>.*)"
+
+    def __init__(self, files, **kwargs):
+        super().__init__("http://localhost", **kwargs)
+        self._files = files
+
+
+def _files(n):
+    return [
+        {
+            "link": f"http://localhost/{i}",
+            "name": f"file_{i}.txt",
+            "size": None,
+            "hash": None,
+            "hash_type": None,
+        }
+        for i in range(n)
+    ]
+
+
+def test_get_print_only_in_order(tmp_path, capsys):
+    _FilesDataset(_files(50), print_only=True)._get(tmp_path)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.split(":")[0].strip() for line in lines] == [
+        f["name"] for f in _files(50)
+    ]
+
+
+@pytest.mark.parametrize("error", [ValueError, KeyboardInterrupt])
+def test_get_cancels_downloads_after_error(tmp_path, error):
+    started = []
+
+    class _FailingDataset(_FilesDataset):
+        def download_file(self, file_link, *args, **kwargs):
+            started.append(file_link)
+            if file_link.endswith("/0"):
+                raise error("download failed")
+            time.sleep(0.05)
+
+    with pytest.raises(error, match="download failed"):
+        _FailingDataset(_files(200))._get(tmp_path)
+
+    assert len(started) < 200
+
+
+def test_get_with_progress(http_server, tmp_path):
+    files = _files(5)
+    for f in files:
+        f["link"] = f["link"].replace("http://localhost", http_server.url)
+        http_server.routes[f"/{f['link'].rsplit('/', 1)[1]}"] = b"x" * 1000
+
+    # run in a thread, a deadlock between the progress bars would hang
+    thread = threading.Thread(
+        target=_FilesDataset(files, progress=True)._get, args=(tmp_path,), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=30)
+
+    assert not thread.is_alive()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f["name"] for f in files]
+
+
+def test_get_skips_failed_files(http_server, tmp_path, capsys):
+    files = _files(3)
+    for f in files:
+        f["link"] = f["link"].replace("http://localhost", http_server.url)
+    http_server.routes.update({"/0": b"0", "/2": b"2"})
+
+    _FilesDataset(files, progress=False)._get(tmp_path)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["file_0.txt", "file_2.txt"]
+    assert "file_1.txt                         : FAILED" in capsys.readouterr().out
+
+
+def test_get_twice_after_removing_output(http_server, tmp_path):
+    files = _files(2)
+    for f in files:
+        f["link"] = f["link"].replace("http://localhost", http_server.url)
+        f["name"] = f"sub/{f['name']}"
+    http_server.routes.update({"/0": b"0", "/1": b"1"})
+
+    dataset = _FilesDataset(files, progress=False)
+    dataset._get(tmp_path / "output")
+    shutil.rmtree(tmp_path / "output")
+    dataset._get(tmp_path / "output")
+
+    assert sorted(p.name for p in (tmp_path / "output" / "sub").iterdir()) == [
+        "file_0.txt",
+        "file_1.txt",
+    ]
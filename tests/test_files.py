@@ -0,0 +1,60 @@
+import json
+
+from datahugger.base import DatasetDownloader
+
+
+class _ListingDataset(DatasetDownloader):
+    REGEXP_ID = r"(?P<record_id>.*)"
+
+    API_URL_META = "{base_url}/root"
+    META_FILES_JSONPATH = "data[*]"
+    PAGINATION_JSONPATH = "next"
+
+    ATTR_KIND_JSONPATH = "kind"
+    ATTR_NAME_JSONPATH = "name"
+    ATTR_FILE_LINK_JSONPATH = "link"
+    ATTR_FOLDER_LINK_JSONPATH = "link"
+
+
+def _page(url, records, next_page=None):
+    return json.dumps(
+        {
+            "data": [
+                {"kind": kind, "name": name, "link": f"{url}/{link}"}
+                for kind, name, link in records
+            ],
+            "next": f"{url}/{next_page}" if next_page else None,
+        }
+    ).encode()
+
+
+def test_files_depth_first_order(http_server):
+    url = http_server.url
+    http_server.routes.update(
+        {
+            "/root": _page(
+                url,
+                [("file", "a", "a"), ("folder", "X", "X"), ("file", "b", "b")],
+                next_page="root2",
+            ),
+            "/root2": _page(url, [("file", "c", "c")]),
+            "/X": _page(
+                url, [("file", "x1", "x1"), ("folder", "Y", "Y")], next_page="X2"
+            ),
+            "/X2": _page(url, [("file", "x2", "x2")]),
+            "/Y": _page(url, [("file", "y1", "y1")]),
+        }
+    )
+
+    # force_download bypasses the metadata cache
+    dataset = _ListingDataset(url, force_download=True)
+
+    assert [f["name"] for f in dataset.files] == [
+        "a",
+        "X/x1",
+        "X/Y/y1",
+        "X/x2",
+        "b",
+        "c",
+    ]
+    assert dataset.files[0]["link"] == f"{url}/a"
@@ -0,0 +1,93 @@
+import pytest
+from jsonpath_ng import parse
+
+from datahugger import services
+from datahugger.base import ATTR_JSONPATH_NAMES
+from datahugger.base import SIMPLE_JSONPATH_REGEXP
+from datahugger.base import DatasetDownloader
+from datahugger.base import _jsonpath_getter
+
+
+def _service_jsonpaths():
+    """All string ATTR_*_JSONPATH values of the services."""
+    jsonpaths = set()
+    for cls in vars(services).values():
+        if isinstance(cls, type) and issubclass(cls, DatasetDownloader):
+            for name in cls._JSONPATH_GETTERS:
+                value = getattr(cls, name, None)
+                if isinstance(value, str):
+                    jsonpaths.add(value)
+
+    return sorted(jsonpaths)
+
+
+def _records(jsonpath):
+    """Records with a match, missing keys, None and list values on the path."""
+    keys = jsonpath.split(".")
+
+    def nest(leaf, depth=None):
+        record = leaf
+        for key in reversed(keys[:depth]):
+            record = {key: record}
+        return record
+
+    records = [nest("value"), nest(None), nest([1, 2]), nest({"x": 1}), [], None]
+    for depth in range(len(keys)):
+        records.extend([nest({}, depth), nest(None, depth), nest([{}], depth)])
+
+    return records
+
+
+def _first_match(getter, record):
+    try:
+        return getter(record)
+    except Exception:
+        return "no match"
+
+
+@pytest.mark.parametrize("jsonpath", _service_jsonpaths())
+def test_simple_jsonpath_matches_jsonpath_ng(jsonpath):
+    assert SIMPLE_JSONPATH_REGEXP.match(jsonpath)
+
+    expression = parse(jsonpath)
+    for record in _records(jsonpath):
+        expected = _first_match(lambda r: expression.find(r)[0].value, record)
+        assert _first_match(_jsonpath_getter(jsonpath), record) == expected
+
+
+@pytest.mark.parametrize("jsonpath", ["files[*]", "data.files[*].dataFile"])
+def test_complex_jsonpath_uses_jsonpath_ng(jsonpath):
+    assert not SIMPLE_JSONPATH_REGEXP.match(jsonpath)
+
+    record = {"files": [{"key": 1}], "data": {"files": [{"dataFile": 2}]}}
+    assert _jsonpath_getter(jsonpath)(record) == parse(jsonpath).find(record)[0].value
+
+
+def _service_attr_jsonpaths():
+    """(class, attribute name) of all ATTR_*_JSONPATH values of the services."""
+    return [
+        (cls, name)
+        for cls in vars(services).values()
+        if isinstance(cls, type) and issubclass(cls, DatasetDownloader)
+        for name in ATTR_JSONPATH_NAMES
+        if isinstance(getattr(cls, name, None), str)
+    ]
+
+
+@pytest.mark.parametrize("cls,name", _service_attr_jsonpaths())
+def test_compiled_attr_jsonpath(cls, name):
+    jsonpath = getattr(cls, name)
+    expression = parse(jsonpath)
+    dataset = cls("https://example.org")
+
+    for record in _records(jsonpath):
+        expected = expression.find(record)[0].value if expression.find(record) else None
+        assert dataset._get_attr_jsonpath(record, name) == expected
+
+
+def test_missing_attr_jsonpath():
+    dataset = services.ZenodoDataset("https://example.org")
+
+    assert dataset._JSONPATH_GETTERS["ATTR_KIND_JSONPATH"] is None
+    assert dataset._get_attr_kind({"kind": "folder"}) == "file"
+    assert dataset._get_attr_jsonpath({}, "ATTR_FOLDER_LINK_JSONPATH") is None